@@ -1,13 +1,24 @@
 /*
 Purpose: Load pre-converted airline logo bitmaps from LittleFS.
 Responsibilities:
-- Mount LittleFS once at startup.
-- Open /logos/{ICAO}.bin, validate exact expected byte count, read into vector.
-- Return false silently for missing airlines (404-equivalent).
+- Mount LittleFS once at startup and load the /logos/logos.idx atlas index.
+- Serve logos by seeking into the already-open /logos/logos.bin atlas.
+- Fall back to /logos/{ICAO}.bin files when there is no atlas entry.
+- Validate exact expected byte counts; return false silently for missing
+  airlines (404-equivalent).
 */
 #include "adapters/LocalLogoStore.h"
 #include "models/FlightInfo.h"
 #include <LittleFS.h>
+#include <algorithm>
+#include <string.h>
+
+static const char *kAtlasPath      = "/logos/logos.bin";
+static const char *kAtlasIndexPath = "/logos/logos.idx";
+static constexpr size_t kAtlasHeaderBytes = 6;  // uint16 count, width, height
+static constexpr size_t kIndexEntryBytes  = 7;  // char icao[3], uint32 offset
+
+static constexpr size_t kLogoBytes = (size_t)AirlineLogo::WIDTH * AirlineLogo::HEIGHT * 2;
 
 bool LocalLogoStore::initialize()
 {
@@ -27,6 +38,90 @@ bool LocalLogoStore::initialize()
     Serial.printf("LocalLogoStore: Filesystem %u bytes total, %u used (%.1f%%)\n",
                   (unsigned)total, (unsigned)used,
                   total > 0 ? (used * 100.0f / total) : 0.0f);
+
+    // Optional — without an atlas every lookup uses the per-airline files.
+    loadAtlas();
+    return true;
+}
+
+bool LocalLogoStore::loadAtlas()
+{
+    if (!LittleFS.exists(kAtlasIndexPath) || !LittleFS.exists(kAtlasPath))
+        return false;
+
+    File idx = LittleFS.open(kAtlasIndexPath, "r");
+    if (!idx)
+    {
+        Serial.printf("LocalLogoStore: Failed to open %s\n", kAtlasIndexPath);
+        return false;
+    }
+    const size_t idxSize = idx.size();
+    if (idxSize == 0 || idxSize % kIndexEntryBytes != 0)
+    {
+        Serial.printf("LocalLogoStore: Bad atlas index size %u\n", (unsigned)idxSize);
+        idx.close();
+        return false;
+    }
+    std::vector<uint8_t> raw(idxSize);
+    size_t bytesRead = idx.read(raw.data(), idxSize);
+    idx.close();
+    if (bytesRead != idxSize)
+    {
+        Serial.printf("LocalLogoStore: Short read for %s\n", kAtlasIndexPath);
+        return false;
+    }
+
+    File atlas = LittleFS.open(kAtlasPath, "r");
+    if (!atlas)
+    {
+        Serial.printf("LocalLogoStore: Failed to open %s\n", kAtlasPath);
+        return false;
+    }
+    uint8_t header[kAtlasHeaderBytes];
+    if (atlas.read(header, kAtlasHeaderBytes) != kAtlasHeaderBytes)
+    {
+        Serial.printf("LocalLogoStore: Short read for %s header\n", kAtlasPath);
+        atlas.close();
+        return false;
+    }
+    const uint16_t width  = (uint16_t)(header[2] | (header[3] << 8));
+    const uint16_t height = (uint16_t)(header[4] | (header[5] << 8));
+    if (width != AirlineLogo::WIDTH || height != AirlineLogo::HEIGHT)
+    {
+        Serial.printf("LocalLogoStore: Atlas logos are %ux%u, expected %ux%u\n",
+                      width, height, AirlineLogo::WIDTH, AirlineLogo::HEIGHT);
+        atlas.close();
+        return false;
+    }
+    const size_t atlasSize = atlas.size();
+
+    _atlasIndex.clear();
+    _atlasIndex.reserve(idxSize / kIndexEntryBytes);
+    for (size_t pos = 0; pos < idxSize; pos += kIndexEntryBytes)
+    {
+        AtlasEntry entry;
+        memcpy(entry.icao, &raw[pos], 3);
+        entry.icao[3] = '\0';
+        // Offsets are little-endian uint32, matching struct '<I' in the tool.
+        entry.offset = (uint32_t)raw[pos + 3]
+                     | ((uint32_t)raw[pos + 4] << 8)
+                     | ((uint32_t)raw[pos + 5] << 16)
+                     | ((uint32_t)raw[pos + 6] << 24);
+        if ((size_t)entry.offset + kLogoBytes > atlasSize)
+        {
+            Serial.printf("LocalLogoStore: Atlas entry for %s is out of range\n", entry.icao);
+            continue;
+        }
+        _atlasIndex.push_back(entry);
+    }
+    // The tool writes the index sorted; sort anyway so a hand-edited index
+    // can't break the binary search.
+    std::sort(_atlasIndex.begin(), _atlasIndex.end(),
+              [](const AtlasEntry &a, const AtlasEntry &b) { return strcmp(a.icao, b.icao) < 0; });
+
+    _atlas = atlas;
+    Serial.printf("LocalLogoStore: Atlas loaded, %u airlines in %u bytes.\n",
+                  (unsigned)_atlasIndex.size(), (unsigned)atlasSize);
     return true;
 }
 
@@ -38,10 +133,48 @@ bool LocalLogoStore::getAirlineLogo(const String &airlineIcao,
     if (!_mounted || airlineIcao.length() == 0)
         return false;
 
-    // Uppercase the ICAO code to match filenames written by the build tool.
+    // Uppercase the ICAO code to match the keys written by the build tool.
     String icao = airlineIcao;
     icao.toUpperCase();
 
+    if (_atlas && readAtlasLogo(icao, outPixels))
+        return true;
+    return readLogoFile(icao, outPixels);
+}
+
+bool LocalLogoStore::readAtlasLogo(const String &icao, std::vector<uint16_t> &outPixels)
+{
+    auto it = std::lower_bound(_atlasIndex.begin(), _atlasIndex.end(), icao.c_str(),
+                               [](const AtlasEntry &entry, const char *key)
+                               { return strcmp(entry.icao, key) < 0; });
+    if (it == _atlasIndex.end() || strcmp(it->icao, icao.c_str()) != 0)
+        return false;  // Not in the atlas — the caller tries the per-airline file.
+
+    if (!_atlas.seek(it->offset))
+    {
+        Serial.printf("LocalLogoStore: Seek failed for %s in atlas\n", icao.c_str());
+        return false;
+    }
+
+    const size_t pixelCount = (size_t)AirlineLogo::WIDTH * AirlineLogo::HEIGHT;
+    outPixels.resize(pixelCount);
+
+    size_t bytesRead = _atlas.read(reinterpret_cast<uint8_t *>(outPixels.data()), kLogoBytes);
+    if (bytesRead != kLogoBytes)
+    {
+        Serial.printf("LocalLogoStore: Short read for %s in atlas: got %u bytes\n",
+                      icao.c_str(), (unsigned)bytesRead);
+        outPixels.clear();
+        return false;
+    }
+
+    Serial.printf("LocalLogoStore: Loaded logo for %s from atlas (%u pixels)\n",
+                  icao.c_str(), (unsigned)pixelCount);
+    return true;
+}
+
+bool LocalLogoStore::readLogoFile(const String &icao, std::vector<uint16_t> &outPixels)
+{
     String path = String("/logos/") + icao + ".bin";
 
     if (!LittleFS.exists(path))
@@ -59,7 +192,7 @@ bool LocalLogoStore::getAirlineLogo(const String &airlineIcao,
         return false;
     }
 
-    const size_t expectedBytes = (size_t)AirlineLogo::WIDTH * AirlineLogo::HEIGHT * 2;
+    const size_t expectedBytes = kLogoBytes;
     size_t fileSize = f.size();
 
     if (fileSize != expectedBytes)
@@ -85,9 +218,8 @@ bool LocalLogoStore::getAirlineLogo(const String &airlineIcao,
         return false;
     }
 
-    // Re-interpret raw bytes as little-endian uint16_t (matches how the
-    // Python build tool writes them with struct.pack('<H', pixel)).
-    // On a little-endian platform (ESP32 is LE) the in-place cast above is
+    // The Python build tool writes little-endian uint16_t pixels. On a
+    // little-endian platform (ESP32 is LE) the in-place read above is
     // already correct — no byte-swapping needed.
 
     Serial.printf("LocalLogoStore: Loaded logo for %s (%u pixels)\n",
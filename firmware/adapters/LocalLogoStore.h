@@ -1,8 +1,16 @@
 #pragma once
 /*
 Purpose: Load pre-converted airline logo bitmaps from LittleFS.
-File layout: /logos/{ICAO_UPPERCASE}.bin
-             Each file is exactly AirlineLogo::WIDTH * AirlineLogo::HEIGHT * 2 bytes
+File layout: /logos/logos.bin  Packed atlas written by tools/build_logos.py:
+                               a 6-byte header {uint16 count, width, height}
+                               followed by `count` logos back to back.
+             /logos/logos.idx  7-byte entries {char icao[3], uint32 offset},
+                               sorted by ICAO; offset is into logos.bin.
+             /logos/{ICAO_UPPERCASE}.bin
+                               Legacy one-file-per-logo layout (build_logos.py
+                               --split), used when the atlas is absent or has
+                               no entry for an airline.
+             Each logo is exactly AirlineLogo::WIDTH * AirlineLogo::HEIGHT * 2 bytes
              of little-endian RGB565 pixels in row-major order.
              Transparent pixels are encoded as 0xF81F (pure magenta).
 Usage: Call initialize() once in setup(). Then call getAirlineLogo() per flight.
@@ -10,6 +18,7 @@ Usage: Call initialize() once in setup(). Then call getAirlineLogo() per flight.
        display falls back to the text-only card layout automatically.
 */
 #include <Arduino.h>
+#include <FS.h>
 #include <vector>
 #include "interfaces/BaseLogoStore.h"
 
@@ -19,7 +28,8 @@ public:
     LocalLogoStore() = default;
     ~LocalLogoStore() override = default;
 
-    // Mount LittleFS. Must be called once in setup() before getAirlineLogo().
+    // Mount LittleFS and load the atlas index if one was uploaded.
+    // Must be called once in setup() before getAirlineLogo().
     // Returns false if the filesystem cannot be mounted (e.g., not formatted).
     bool initialize();
 
@@ -29,5 +39,17 @@ public:
                         std::vector<uint16_t> &outPixels) override;
 
 private:
+    struct AtlasEntry
+    {
+        char icao[4];     // NUL-terminated uppercase ICAO code
+        uint32_t offset;  // Byte offset of the logo within logos.bin
+    };
+
+    bool loadAtlas();
+    bool readAtlasLogo(const String &icao, std::vector<uint16_t> &outPixels);
+    bool readLogoFile(const String &icao, std::vector<uint16_t> &outPixels);
+
     bool _mounted = false;
+    File _atlas;                          // Kept open; logos are read by seeking.
+    std::vector<AtlasEntry> _atlasIndex;  // Sorted by icao for binary search.
 };
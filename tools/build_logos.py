@@ -3,17 +3,27 @@
 build_logos.py — FlightWall local airline logo builder
 =======================================================
 Downloads PNG logos for the top commercial airlines, converts them to
-24×24 RGB565 binary blobs, and writes them to firmware/data/logos/{ICAO}.bin
-ready for upload to the ESP32 via LittleFS.
+32×32 RGB565 binary blobs, and packs them into firmware/data/logos/logos.bin
++ logos.idx (or one {ICAO}.bin each with --split) ready for upload to the
+ESP32 via LittleFS.
 
 Usage:
     pip install Pillow requests
+    pip install numpy            # optional, vectorises the RGB565 encode
+    pip install numba            # optional, compiles a fused encode kernel
+    pip install pic-scale        # optional, SIMD Lanczos resize
+    pip install 'httpx[http2]'   # optional, enables --http2
+    pip install 'pyvips[binary]' # optional, enables --vips
     python tools/build_logos.py [--width W] [--height H] [--out OUT_DIR]
+                                [--oversample N] [--split] [--http2] [--vips]
+                                [--refresh-cache]
 
 Logo source:
     Uses the free Airhex CDN (no API key required for small-resolution PNGs).
     URL: https://content.airhex.com/content/logos/airlines_{IATA}_{W}_{H}_r.png
     Each airline entry below maps ICAO -> IATA so both lookup systems work.
+    The CDN resizes server-side, so logos are fetched at the target size by
+    default; --oversample N fetches N x larger and Lanczos-downsamples locally.
 
 Transparency:
     Transparent and background pixels are encoded as 0xF81F (pure magenta in
@@ -21,8 +31,14 @@ Transparency:
     black LED background show through.
 
 Output:
-    firmware/data/logos/{ICAO_UPPERCASE}.bin
-    Each file: W * H * 2 bytes, little-endian uint16_t RGB565, row-major.
+    firmware/data/logos/logos.bin + logos.idx
+    One packed atlas of every logo plus its ICAO index; see "Atlas output".
+    Each logo: W * H * 2 bytes, little-endian uint16_t RGB565, row-major.
+    firmware/data/logos/{ICAO_UPPERCASE}.bin   (with --split)
+    The same logos as one file each, the format used by older firmware.
+    firmware/data/logos/airlines.json
+    {"ICAO": "IATA", ...} for every entry in AIRLINE_LIST, so the device
+    gets the mapping without building its own table.
 
 Customisation:
     Add airlines to AIRLINE_LIST below as ("ICAO", "IATA", "Human name").
@@ -30,37 +46,111 @@ Customisation:
 """
 
 import argparse
+import asyncio
+import email.utils
+import functools
+import hashlib
 import io
+import json
+import os
 import struct
 import sys
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 try:
     import requests
     from PIL import Image
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     print("ERROR: Missing dependencies. Run: pip install Pillow requests")
     sys.exit(1)
 
+# Optional: NumPy vectorises the RGB565 encode. Without it the pure-Python
+# per-pixel loop is used, which produces identical output, just slower.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Optional, on top of NumPy: Numba JIT-compiles a fused single-pass encode.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Optional: httpx (with its http2 extra) enables --http2, which multiplexes
+# every download over a single HTTP/2 connection instead of the thread pool.
+# h2 is checked too: with our own http2=True transport httpx skips its check,
+# and a plain httpx install would then fail on the first HTTP/2 connection.
+try:
+    import h2  # noqa: F401
+    import httpx
+except ImportError:
+    httpx = None
+
+# Optional: pyvips (libvips) enables --vips, which decodes, resizes and packs
+# each logo in one streaming libvips pipeline instead of Pillow + NumPy.
+# OSError covers pyvips installed without the libvips shared library.
+try:
+    import pyvips
+except (ImportError, OSError):
+    pyvips = None
+
+# Optional: pic-scale is a SIMD Lanczos resampler with a Pillow-compatible
+# API. Without it Pillow's own Image.resize is used.
+try:
+    import pic_scale
+except ImportError:
+    pic_scale = None
+
 # ─── Configurable defaults ────────────────────────────────────────────────────
 DEFAULT_WIDTH  = 32
 DEFAULT_HEIGHT = 32
+DEFAULT_OVERSAMPLE = 1
 SCRIPT_DIR     = Path(__file__).parent
 DEFAULT_OUT    = SCRIPT_DIR.parent / "firmware" / "data" / "logos"
+CACHE_DIR      = SCRIPT_DIR / ".logo_cache"
 
 # Transparent colour: pure magenta in RGB565
 TRANSPARENT_RGB565 = 0xF81F
 
-# Delay between requests to be a polite CDN user
-REQUEST_DELAY_S = 0.5
+# Precompiled little-endian uint16 packer for the pure-Python encoder, so the
+# format string is parsed once rather than once per pixel.
+_U16 = struct.Struct('<H')
+
+# SWAR lanes for the same encoder: four RGBA pixels are read as one 128-bit
+# little-endian int (a 32-bit lane per pixel) and leave as four RGB565 values
+# in one '<Q' (a 16-bit lane per pixel). The masks repeat per lane.
+_U64          = struct.Struct('<Q')
+_LANES32      = 0x00000001_00000001_00000001_00000001
+_LANES16      = 0x0001_0001_0001_0001
+SWAR_ALPHA    = 0xFF000000 * _LANES32  # every alpha byte
+SWAR_VISIBLE  = 0xF0000000 * _LANES32  # set in a lane iff its alpha >= 16
+SWAR_R5       = 0x000000F8 * _LANES32
+SWAR_G6       = 0x0000FC00 * _LANES32
+SWAR_B5       = 0x00F80000 * _LANES32
+SWAR_SENTINEL = TRANSPARENT_RGB565 * _LANES16
+
+# Logos per task when the pure-Python encode is spread over worker processes.
+PYTHON_ENCODE_CHUNK = 8
+
+# Downloads run concurrently, so slow responses overlap, but the rate limit
+# keeps the CDN load where the original sequential 0.5 s delay put it: at
+# most 2 requests starting per second across all workers, with no burst.
+MAX_WORKERS        = 8
+REQUEST_RATE_PER_S = 2.0
+REQUEST_BURST      = 1
 
 # ─── Airline list ─────────────────────────────────────────────────────────────
 # Format: ("ICAO", "IATA", "Display name for logging")
 # ICAO is the lookup key on the ESP32; IATA is used in the logo URL.
 # Ordered roughly by global passenger volume so partial runs cover the
 # most common airlines first.
-AIRLINE_LIST = [
+AIRLINE_LIST: tuple[tuple[str, str, str], ...] = (
     # ── United States ─────────────────────────────────────────────────────────
     ("AAL", "AA", "American Airlines"),
     ("DAL", "DL", "Delta Air Lines"),
@@ -173,7 +263,13 @@ AIRLINE_LIST = [
     ("AFL", "SU", "Aeroflot"),
     ("SDM", "FV", "Rossiya Airlines"),
     ("SVP", "UT", "UTair"),
-]
+)
+
+
+@functools.lru_cache(maxsize=None)
+def icao_to_iata() -> dict[str, str]:
+    """ICAO -> IATA mapping for AIRLINE_LIST, built on first use."""
+    return {icao.upper(): iata for icao, iata, _ in AIRLINE_LIST}
 
 
 # ─── Conversion helpers ───────────────────────────────────────────────────────
@@ -186,37 +282,369 @@ def rgb_to_rgb565(r: int, g: int, b: int) -> int:
     return (r5 << 11) | (g6 << 5) | b5
 
 
-def image_to_rgb565_blob(img: Image.Image, width: int, height: int) -> bytes:
+if np is not None:
+    # Per-channel lookup tables holding each 8-bit value already shifted into
+    # its RGB565 field, so a pixel packs as LUT_R[r] | LUT_G[g] | LUT_B[b].
+    _CHANNEL_VALUES = np.arange(256, dtype="<u2")
+    LUT_R = ((_CHANNEL_VALUES >> 3) & 0x1F) << 11
+    LUT_G = ((_CHANNEL_VALUES >> 2) & 0x3F) << 5
+    LUT_B =  (_CHANNEL_VALUES >> 3) & 0x1F
+
+
+@functools.lru_cache(maxsize=None)
+def _resize_plan(src_size: tuple[int, int], dst_size: tuple[int, int]):
     """
-    Resize img to (width, height) using high-quality downsampling, then
-    convert each pixel to RGB565. Fully-transparent pixels (alpha < 16) are
-    encoded as TRANSPARENT_RGB565 (0xF81F) so the display can skip them.
-    Returns a bytes object of length width*height*2 (little-endian uint16_t).
+    pic-scale Plan for one (source, target) size pair. Every airline normally
+    shares the same pair, so the Lanczos filter weights are computed once per
+    run instead of once per logo.
     """
-    # Resize to target dimensions with high-quality Lanczos filter.
+    return pic_scale.Plan(src_size, dst_size, pic_scale.Resampling.LANCZOS, "RGBA",
+                          premultiply_alpha=True)
+
+
+def _resize_rgba(img: Image.Image, width: int, height: int) -> Image.Image:
+    """Lanczos-resize an RGBA image, via pic-scale when it is installed."""
+    if img.size == (width, height):
+        return img
+    if pic_scale is not None:
+        return _resize_plan(img.size, (width, height)).resize(img)
+    return img.resize((width, height), Image.LANCZOS)
+
+
+def _encode_rgb565_numpy(rgba: "np.ndarray") -> "np.ndarray":
+    """Vectorised RGBA -> RGB565 encode of a (..., H, W, 4) uint8 array."""
+    a   = rgba[..., 3].astype(np.uint16)
+    # Blend onto black background proportionally to alpha (r*a <= 65025).
+    rgb = (rgba[..., :3].astype(np.uint16) * a[..., None]) // 255
+
+    pix = LUT_R[rgb[..., 0]] | LUT_G[rgb[..., 1]] | LUT_B[rgb[..., 2]]
+
+    # Avoid accidentally hitting the transparency sentinel, then mark the
+    # genuinely transparent pixels with it. pix is a fresh array from the
+    # gathers, so both fixes can be applied in place.
+    pix[pix == TRANSPARENT_RGB565] = 0xF820
+    pix[a < 16] = TRANSPARENT_RGB565
+    # Already little-endian on every target host, where this is a no-op.
+    return pix.astype("<u2", copy=False)
+
+
+if njit is not None:
+    @functools.lru_cache(maxsize=None)
+    def _rgb565_kernel(width: int, height: int):
+        """
+        Compile the fused encode for one logo size. width and height are
+        closure constants, so the pixel loops have fixed trip counts that
+        LLVM can unroll, with no shape lookups. Each size is compiled once
+        and then served from Numba's on-disk cache.
+        """
+        @njit(cache=True, nogil=True)
+        def kernel(rgba, out):
+            """
+            Fused alpha blend + RGB565 pack + sentinel handling, one pass over
+            the (N, height, width, 4) pixels straight into the preallocated
+            (N, height, width) uint16 `out`.
+            """
+            for n in range(out.shape[0]):
+                for y in range(height):
+                    for x in range(width):
+                        a = int(rgba[n, y, x, 3])
+                        if a < 16:
+                            out[n, y, x] = TRANSPARENT_RGB565
+                            continue
+                        r = int(rgba[n, y, x, 0]) * a // 255
+                        g = int(rgba[n, y, x, 1]) * a // 255
+                        b = int(rgba[n, y, x, 2]) * a // 255
+                        p = ((r >> 3) << 11) | ((g >> 2) << 5) | (b >> 3)
+                        if p == TRANSPARENT_RGB565:
+                            p = 0xF820
+                        out[n, y, x] = p
+
+        return kernel
+
+
+def _encode_rgb565_numba(rgba: "np.ndarray") -> "np.ndarray":
+    """
+    RGBA -> RGB565 encode of a (..., H, W, 4) uint8 array through the
+    size-specialised _rgb565_kernel. Leading dimensions are folded into one
+    batch axis.
+    """
+    height, width = rgba.shape[-3], rgba.shape[-2]
+    batch = np.ascontiguousarray(rgba).reshape(-1, height, width, 4)
+    out   = np.empty(batch.shape[:3], dtype="<u2")
+    _rgb565_kernel(width, height)(batch, out)
+    return out.reshape(rgba.shape[:-1])
+
+
+def _rgba_to_rgb565(r: int, g: int, b: int, a: int) -> int:
+    """One RGBA pixel -> RGB565, blended onto black with the sentinel rules."""
+    if a < 16:
+        return TRANSPARENT_RGB565
+    # Blend onto black background proportionally to alpha.
+    pixel16 = rgb_to_rgb565(r * a // 255, g * a // 255, b * a // 255)
+    # Avoid accidentally hitting the transparency sentinel.
+    if pixel16 == TRANSPARENT_RGB565:
+        pixel16 = 0xF820  # slightly off-magenta, visually identical
+    return pixel16
+
+
+def _encode_rgb565_python(data: bytes, width: int, height: int) -> bytearray:
+    """
+    RGBA -> RGB565 encode of a raw row-major RGBA buffer (as from
+    Image.tobytes()); fallback when NumPy is unavailable. Takes plain bytes
+    so it can run in a worker process.
+
+    Pixels are taken four at a time as SWAR lanes. Logos are mostly fully
+    transparent background and fully opaque artwork, and such groups are
+    handled with a few whole-int shifts and masks and one 64-bit store;
+    only groups with partial alpha (anti-aliased edges) and the tail go
+    through the per-pixel path.
+    """
+    blob = bytearray(width * height * 2)
+    pack16 = _U16.pack_into
+    pack64 = _U64.pack_into
+    from_bytes = int.from_bytes
+    quads = len(data) & ~15
+
+    for i in range(0, quads, 16):
+        q = from_bytes(data[i:i + 16], "little")
+        if not q & SWAR_VISIBLE:
+            pack64(blob, i >> 1, SWAR_SENTINEL)
+            continue
+        if q & SWAR_ALPHA == SWAR_ALPHA:
+            # Opaque, so no blend: pack each 32-bit lane to RGB565 in place,
+            # then compact the four results into 16-bit lanes.
+            p = ((q & SWAR_R5) << 8) | ((q & SWAR_G6) >> 5) | ((q & SWAR_B5) >> 19)
+            p |= p >> 16
+            p = (p & 0xFFFFFFFF) | ((p >> 32) & 0xFFFFFFFF_00000000)
+            # Store unless some lane hit the sentinel (zero-lane test on p ^ sentinel).
+            x = p ^ SWAR_SENTINEL
+            if not (x - _LANES16) & ~x & (0x8000 * _LANES16):
+                pack64(blob, i >> 1, p)
+                continue
+        for j in range(i, i + 16, 4):
+            pack16(blob, j >> 1, _rgba_to_rgb565(data[j], data[j + 1], data[j + 2], data[j + 3]))
+
+    for j in range(quads, len(data), 4):
+        pack16(blob, j >> 1, _rgba_to_rgb565(data[j], data[j + 1], data[j + 2], data[j + 3]))
+
+    return blob
+
+
+def prepare_rgba(img: Image.Image, width: int, height: int) -> Image.Image:
+    """Convert img to RGBA and resize it to (width, height) with Lanczos filtering."""
     img = img.convert("RGBA")
-    img = img.resize((width, height), Image.LANCZOS)
+    return _resize_rgba(img, width, height)
 
-    blob = bytearray()
-    pixels = img.load()
 
-    for y in range(height):
-        for x in range(width):
-            r, g, b, a = pixels[x, y]
-            if a < 16:
-                pixel16 = TRANSPARENT_RGB565
-            else:
-                # Blend onto black background proportionally to alpha.
-                r = int(r * a / 255)
-                g = int(g * a / 255)
-                b = int(b * a / 255)
-                pixel16 = rgb_to_rgb565(r, g, b)
-                # Avoid accidentally hitting the transparency sentinel.
-                if pixel16 == TRANSPARENT_RGB565:
-                    pixel16 = 0xF820  # slightly off-magenta, visually identical
-            blob += struct.pack('<H', pixel16)
+def encode_rgb565_batch(images: list[Image.Image], width: int,
+                        height: int) -> list[memoryview]:
+    """
+    Convert prepared (width x height RGBA) images to RGB565. Fully-transparent
+    pixels (alpha < 16) are encoded as TRANSPARENT_RGB565 (0xF81F) so the
+    display can skip them. With NumPy the images are stacked into one
+    (N, H, W, 4) array and encoded in a single call.
+    Returns one flat byte memoryview of length width*height*2 (little-endian
+    uint16_t) per image, over the encoder's own buffer, so no extra copy is made.
+    """
+    if not images:
+        return []
+    if np is None:
+        # The pure-Python loop holds the GIL, so spread larger batches over
+        # one process per core; small ones aren't worth the pool start-up.
+        buffers = [img.tobytes() for img in images]
+        if len(buffers) > PYTHON_ENCODE_CHUNK and (os.cpu_count() or 1) > 1:
+            with ProcessPoolExecutor() as pool:
+                blobs = list(pool.map(_encode_rgb565_python, buffers,
+                                      [width] * len(buffers), [height] * len(buffers),
+                                      chunksize=PYTHON_ENCODE_CHUNK))
+        else:
+            blobs = [_encode_rgb565_python(buf, width, height) for buf in buffers]
+        return [memoryview(blob).cast("B") for blob in blobs]
 
-    return bytes(blob)
+    # Pillow only hands its pixels out as a fresh bytes copy (tobytes() or the
+    # array interface alike), so copy each one into a preallocated batch as it
+    # is produced; only one such temporary is alive at a time.
+    stack = np.empty((len(images), height, width, 4), dtype=np.uint8)
+    for i, img in enumerate(images):
+        stack[i] = np.frombuffer(img.tobytes(), dtype=np.uint8).reshape(height, width, 4)
+    if njit is not None:
+        pixels = _encode_rgb565_numba(stack)
+    else:
+        pixels = _encode_rgb565_numpy(stack)
+    # A uint8 view of each '<u2' slice exposes its bytes without a copy or a
+    # byte-order check.
+    return [memoryview(logo.view(np.uint8)).cast("B") for logo in pixels]
+
+
+def image_to_rgb565_blob(img: Image.Image, width: int, height: int) -> memoryview:
+    """
+    Resize img to (width, height) using high-quality downsampling, then
+    convert each pixel to RGB565. Single-image form of encode_rgb565_batch.
+    """
+    return encode_rgb565_batch([prepare_rgba(img, width, height)], width, height)[0]
+
+
+def vips_rgb565_blob(png_bytes: bytes, width: int, height: int) -> bytes:
+    """
+    --vips pipeline: decode, Lanczos-resize and RGB565-encode one PNG in
+    libvips. With sequential access, rows stream from the PNG decoder through
+    the resize and the packing without a full-size intermediate image.
+    Output is little-endian like image_to_rgb565_blob.
+    """
+    img = pyvips.Image.pngload_buffer(png_bytes, access="sequential")
+    if img.interpretation != "srgb":
+        img = img.colourspace("srgb")  # greyscale / 16-bit PNGs
+    if not img.hasalpha():
+        img = img.bandjoin(255)
+
+    # Premultiplying is the blend onto the black background, as in
+    # prepare_rgba; doing it before the resize keeps edges from fringing.
+    img = img.premultiply()
+    if (img.width, img.height) != (width, height):
+        img = img.resize(width / img.width, vscale=height / img.height, kernel="lanczos3")
+    img = img.cast("uchar")
+
+    r, g, b, a = (img[band].cast("ushort") for band in range(4))
+    pix = ((r >> 3) << 11) | ((g >> 2) << 5) | (b >> 3)
+    pix = (pix == TRANSPARENT_RGB565).ifthenelse(0xF820, pix)
+    pix = (a < 16).ifthenelse(TRANSPARENT_RGB565, pix).cast("ushort")
+    if sys.byteorder == "big":
+        pix = pix.byteswap()  # write_to_memory is host order
+    return bytes(pix.write_to_memory())
+
+
+def write_blob(path: Path, blob: memoryview) -> None:
+    """Hand the encoded buffer straight to write(2), without a bytes copy."""
+    with open(path, "wb", buffering=0) as f:
+        while blob:
+            blob = blob[f.write(blob):]
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write via a temp file + rename so an interrupted run never leaves a torn file."""
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+# ─── Atlas output ─────────────────────────────────────────────────────────────
+# By default all logos are packed into one file so the device opens a single
+# file instead of one per airline:
+#   logos.bin  ATLAS_HEADER {count, width, height}, then `count` RGB565 blobs
+#              back to back (identical logos are stored once).
+#   logos.idx  One ATLAS_INDEX_ENTRY {ICAO, byte offset into logos.bin} per
+#              airline, sorted by ICAO so the device can binary-search it.
+#   logos.bin.blake2b
+#              Hex BLAKE2b digest of logos.bin + logos.idx + airlines.json,
+#              everything uploadfs ships from this directory. A rebuild with
+#              the same digest leaves the files untouched and needs no uploadfs.
+
+ATLAS_NAME        = "logos.bin"
+ATLAS_INDEX_NAME  = "logos.idx"
+ATLAS_HEADER      = struct.Struct("<HHH")
+ATLAS_INDEX_ENTRY = struct.Struct("<3sI")
+ATLAS_DIGEST_NAME = ATLAS_NAME + ".blake2b"
+
+
+def write_atlas(out_dir: Path, logos: dict[str, bytes | memoryview],
+                width: int, height: int, airlines_json: bytes) -> tuple[bytes, bool]:
+    """
+    Pack {ICAO: blob} into logos.bin + logos.idx in out_dir. Blobs that are
+    the same object (deduplicated logos) or hold the same bytes share one
+    slot. `airlines_json` is the already-written airlines.json, hashed in
+    with the atlas so a changed mapping also counts as a change. If the
+    digest matches ATLAS_DIGEST_NAME from the previous build, nothing is
+    rewritten.
+    Returns (atlas bytes, whether anything changed on disk). Raises
+    ValueError for an ICAO key that doesn't fit the 3-byte index field.
+    """
+    slots: dict[bytes, int] = {}
+    chunks: list[bytes | memoryview] = []
+    index: list[bytes] = []
+    offset = ATLAS_HEADER.size
+    for icao in sorted(logos):
+        blob = logos[icao]
+        key = bytes(blob)
+        if key not in slots:
+            slots[key] = offset
+            chunks.append(blob)
+            offset += len(blob)
+        # '3s' would silently truncate or NUL-pad any other length.
+        key_bytes = icao.upper().encode("ascii")
+        if len(key_bytes) != 3:
+            raise ValueError(f"ICAO code {icao!r} is not 3 characters; fix AIRLINE_LIST")
+        index.append(ATLAS_INDEX_ENTRY.pack(key_bytes, slots[key]))
+
+    atlas = b"".join([ATLAS_HEADER.pack(len(chunks), width, height), *chunks])
+    index_bytes = b"".join(index)
+
+    digest = hashlib.blake2b(digest_size=32)
+    digest.update(atlas)
+    digest.update(index_bytes)
+    digest.update(airlines_json)
+    digest_hex = digest.hexdigest()
+
+    digest_path = out_dir / ATLAS_DIGEST_NAME
+    try:
+        unchanged = (digest_path.read_text().strip() == digest_hex
+                     and (out_dir / ATLAS_NAME).is_file()
+                     and (out_dir / ATLAS_INDEX_NAME).is_file())
+    except OSError:
+        unchanged = False
+    if unchanged:
+        return atlas, False
+
+    _atomic_write(out_dir / ATLAS_NAME, atlas)
+    _atomic_write(out_dir / ATLAS_INDEX_NAME, index_bytes)
+    _atomic_write(digest_path, (digest_hex + "\n").encode())
+    return atlas, True
+
+
+def read_atlas(out_dir: Path, width: int, height: int) -> dict[str, bytes]:
+    """
+    Load {ICAO: blob} back from an existing atlas so its logos can carry over
+    into the next one. Returns {} if there is no atlas or it was built for a
+    different logo size.
+    """
+    try:
+        atlas = (out_dir / ATLAS_NAME).read_bytes()
+        index = (out_dir / ATLAS_INDEX_NAME).read_bytes()
+    except OSError:
+        return {}
+    if len(atlas) < ATLAS_HEADER.size:
+        return {}
+    _, atlas_w, atlas_h = ATLAS_HEADER.unpack_from(atlas)
+    if (atlas_w, atlas_h) != (width, height):
+        return {}
+
+    blob_bytes = width * height * 2
+    logos = {}
+    usable = len(index) - len(index) % ATLAS_INDEX_ENTRY.size
+    for icao, offset in ATLAS_INDEX_ENTRY.iter_unpack(index[:usable]):
+        if offset + blob_bytes <= len(atlas):
+            logos[icao.decode("ascii")] = atlas[offset:offset + blob_bytes]
+    return logos
+
+
+def retire_atlas(out_dir: Path, width: int, height: int) -> int:
+    """
+    Remove an atlas left in out_dir by an earlier run when --split writes
+    per-airline files; the firmware prefers the atlas, so it would hide them.
+    Logos it holds for airlines still in AIRLINE_LIST that have no {ICAO}.bin
+    yet are written out first, so nothing the device had is lost. Returns how
+    many were written.
+    """
+    written = 0
+    for icao, blob in read_atlas(out_dir, width, height).items():
+        if icao not in icao_to_iata():
+            continue
+        path = out_dir / f"{icao}.bin"
+        if not path.exists():
+            write_blob(path, memoryview(blob))
+            written += 1
+    for name in (ATLAS_NAME, ATLAS_INDEX_NAME, ATLAS_DIGEST_NAME):
+        (out_dir / name).unlink(missing_ok=True)
+    return written
 
 
 # ─── Logo download ────────────────────────────────────────────────────────────
@@ -227,19 +655,339 @@ LOGO_URL_TEMPLATE = (
     "?theme=dark"
 )
 
+# Responses smaller than this are placeholders or error stubs, not logos.
+# Kept well below the size of a real logo even at small fetch sizes.
+MIN_LOGO_PNG_BYTES = 128
+PNG_SIGNATURE      = b"\x89PNG\r\n\x1a\n"
+PNG_TRAILER        = b"IEND\xaeB`\x82"  # IEND chunk type + CRC, last in every PNG
+
+
+REQUEST_HEADERS = {
+    "User-Agent":      "FlightWall-LogoBuilder/1.0",
+    "Accept":          "image/png",
+    "Accept-Encoding": "gzip",
+}
+
+# One shared session for the whole run. Every logo lives on the same CDN host,
+# so a pooled keep-alive connection saves a TCP + TLS handshake per airline.
+# Transient gateway errors are retried with exponential backoff.
+_SESSION = requests.Session()
+_SESSION.headers.update(REQUEST_HEADERS)
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=MAX_WORKERS,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504]),
+))
+
+
+def _cache_path(iata: str, width: int, height: int) -> Path:
+    return CACHE_DIR / f"{iata}_{width}x{height}.png"
+
+
+def load_cached_logo(iata: str, width: int, height: int) -> bytes | None:
+    """
+    Return cached PNG bytes for this logo without touching the network, or
+    None on a cache miss. An exact-size entry is preferred; otherwise the
+    smallest cached PNG that is at least as large with the same aspect ratio
+    is used, since image_to_rgb565_blob downsamples to the target anyway.
+    """
+    exact = _read_cached_logo(_cache_path(iata, width, height))
+    if exact is not None:
+        return exact
+
+    candidates: list[tuple[int, Path]] = []
+    for candidate in CACHE_DIR.glob(f"{iata}_*x*.png"):
+        try:
+            cw, ch = (int(v) for v in candidate.stem.rsplit("_", 1)[1].split("x"))
+        except ValueError:
+            continue
+        if cw < width or ch < height or cw * height != ch * width:
+            continue
+        candidates.append((cw, candidate))
+    for _, candidate in sorted(candidates):
+        png_bytes = _read_cached_logo(candidate)
+        if png_bytes is not None:
+            return png_bytes
+    return None
+
+
+def _read_cached_logo(cache_path: Path) -> bytes | None:
+    """
+    Cached PNG bytes, or None if there is no usable entry. An entry that
+    isn't a plausible PNG (truncated, or a stub from an older build) is
+    deleted, so it is fetched again instead of failing to decode every run.
+    """
+    try:
+        png_bytes = cache_path.read_bytes()
+    except OSError:
+        return None
+    if _plausible_logo_body(png_bytes):
+        return png_bytes
+    for path in (cache_path, cache_path.with_suffix(".meta")):
+        try:
+            path.unlink(missing_ok=True)
+        except OSError:
+            pass
+    return None
+
+
+def _revalidation_headers(cache_path: Path) -> dict[str, str]:
+    """
+    If-Modified-Since header for a cached logo, or {} when nothing usable is
+    cached; a bad entry must not be revalidated, or a 304 would keep it.
+    """
+    if _read_cached_logo(cache_path) is None:
+        return {}
+    last_modified = None
+    try:
+        meta = json.loads(cache_path.with_suffix(".meta").read_text())
+        last_modified = meta.get("last_modified")
+    except (OSError, ValueError):
+        pass
+    if not last_modified:
+        last_modified = email.utils.formatdate(cache_path.stat().st_mtime, usegmt=True)
+    return {"If-Modified-Since": last_modified}
+
+
+def _plausible_logo_headers(headers) -> bool:
+    """Check run before the body is read: image/png and not a tiny stub."""
+    content_type = headers.get("Content-Type", "").split(";")[0].strip()
+    if content_type != "image/png":
+        return False
+    length = headers.get("Content-Length")
+    return not (length is not None and length.isdigit() and int(length) < MIN_LOGO_PNG_BYTES)
+
+
+def _plausible_logo_body(png_bytes: bytes) -> bool:
+    return (len(png_bytes) >= MIN_LOGO_PNG_BYTES and png_bytes.startswith(PNG_SIGNATURE)
+            and png_bytes.endswith(PNG_TRAILER))
+
+
+def _store_cached_logo(cache_path: Path, url: str, png_bytes: bytes,
+                       last_modified: str | None) -> None:
+    """Best-effort: the cache only saves downloads, so a failed write is logged, not raised."""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _atomic_write(cache_path, png_bytes)
+        meta = {"url": url, "last_modified": last_modified}
+        _atomic_write(cache_path.with_suffix(".meta"), json.dumps(meta).encode())
+    except OSError as e:
+        print(f"    {cache_path.name}: not cached ({e})")
+
 
 def fetch_logo_png(iata: str, width: int, height: int) -> bytes | None:
-    """Download a PNG logo from Airhex CDN. Returns raw PNG bytes or None."""
+    """
+    Download a PNG logo from Airhex CDN. Returns raw PNG bytes or None.
+    The response headers are checked before the body is read. Anything that
+    is not image/png, or whose Content-Length is below MIN_LOGO_PNG_BYTES,
+    is dropped without being downloaded or decoded.
+    Successful downloads are stored in CACHE_DIR. If a cached copy already
+    exists the request is conditional (If-Modified-Since) and a 304 reply
+    returns the cached bytes.
+    """
     url = LOGO_URL_TEMPLATE.format(iata=iata, width=width, height=height)
+    cache_path = _cache_path(iata, width, height)
+    headers = _revalidation_headers(cache_path)
+
     try:
-        resp = requests.get(url, timeout=10)
-        if resp.status_code == 200 and resp.headers.get("Content-Type", "").startswith("image"):
-            return resp.content
-        else:
-            return None
+        with _SESSION.get(url, timeout=10, headers=headers, stream=True) as resp:
+            if resp.status_code == 304 and headers:
+                return _read_cached_logo(cache_path)
+            if resp.status_code != 200 or not _plausible_logo_headers(resp.headers):
+                return None
+            png_bytes = resp.content
     except requests.RequestException as e:
-        print(f"    Network error: {e}")
+        print(f"    {iata}: network error: {e}")
+        return None
+
+    if not _plausible_logo_body(png_bytes):
+        return None
+    _store_cached_logo(cache_path, url, png_bytes, resp.headers.get("Last-Modified"))
+    return png_bytes
+
+
+async def fetch_logo_png_async(client: "httpx.AsyncClient", iata: str,
+                               width: int, height: int) -> bytes | None:
+    """fetch_logo_png over a shared httpx HTTP/2 client, used with --http2."""
+    url = LOGO_URL_TEMPLATE.format(iata=iata, width=width, height=height)
+    cache_path = _cache_path(iata, width, height)
+    headers = _revalidation_headers(cache_path)
+
+    try:
+        async with client.stream("GET", url, headers=headers) as resp:
+            if resp.status_code == 304 and headers:
+                return _read_cached_logo(cache_path)
+            if resp.status_code != 200 or not _plausible_logo_headers(resp.headers):
+                return None
+            png_bytes = await resp.aread()
+    except httpx.HTTPError as e:
+        print(f"    {iata}: network error: {e}")
+        return None
+
+    if not _plausible_logo_body(png_bytes):
         return None
+    _store_cached_logo(cache_path, url, png_bytes, resp.headers.get("Last-Modified"))
+    return png_bytes
+
+
+class RateLimiter:
+    """
+    Token bucket shared by all downloads. Up to `burst` requests may start
+    back-to-back after an idle spell; after that, starts are spaced 1/rate
+    seconds apart. Threads call acquire(); coroutines await
+    asyncio.sleep(reserve()).
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self._interval = 1.0 / rate
+        self._burst    = burst
+        self._lock     = threading.Lock()
+        self._next     = time.monotonic()  # earliest start time for the next request
+
+    def reserve(self) -> float:
+        """Claim the next start slot. Returns the seconds to wait until it."""
+        with self._lock:
+            now   = time.monotonic()
+            start = max(self._next, now - (self._burst - 1) * self._interval)
+            self._next = start + self._interval
+        return max(0.0, start - now)
+
+    def acquire(self) -> None:
+        """Block the calling thread until its start slot."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+
+# ─── Per-airline pipeline ─────────────────────────────────────────────────────
+
+# A prepared logo: a resized RGBA Image awaiting encode_rgb565_batch, or, on
+# the --vips path, the finished RGB565 blob.
+PreparedLogo = Image.Image | bytes
+
+
+class LogoDecoder:
+    """
+    Decodes and prepares downloaded PNGs for one run. Results are hash-consed
+    by PNG digest: airlines sharing a logo (or the CDN's placeholder) get the
+    very same object back, so phase 2 can encode it once. Safe to call from
+    worker threads.
+    """
+
+    def __init__(self, width: int, height: int, use_vips: bool = False):
+        self.width    = width
+        self.height   = height
+        self.use_vips = use_vips
+        self._decoded: dict[bytes, PreparedLogo] = {}
+
+    def decode(self, png_bytes: bytes | None, source: str) -> tuple[PreparedLogo | None, str]:
+        if png_bytes is None:
+            return None, "FAILED (no logo)"
+        detail = f"{source} ({len(png_bytes)} bytes PNG)"
+        digest = hashlib.blake2b(png_bytes, digest_size=16).digest()
+        logo = self._decoded.get(digest)
+        if logo is not None:
+            return logo, f"{detail}, duplicate logo"
+        try:
+            if self.use_vips:
+                logo = vips_rgb565_blob(png_bytes, self.width, self.height)
+            else:
+                logo = prepare_rgba(Image.open(io.BytesIO(png_bytes)),
+                                    self.width, self.height)
+        except Exception as e:
+            return None, f"FAILED ({e})"
+        return self._decoded.setdefault(digest, logo), detail
+
+
+def download_airline_logo(entry: tuple[str, str, str], width: int, height: int,
+                          oversample: int, refresh_cache: bool, limiter: RateLimiter,
+                          decoder: LogoDecoder) -> tuple[PreparedLogo | None, str]:
+    """
+    Fetch one airline logo and prepare it at (width, height) with `decoder`.
+    Runs on a worker thread. Returns (logo, detail); logo is None on failure
+    and detail is the human-readable result for the progress log.
+    """
+    _, iata, _ = entry
+
+    # Fetch at oversample x the target size (1 = let the CDN do the resize).
+    # The local cache is consulted first unless --refresh-cache asks us to
+    # revalidate against the CDN.
+    fetch_w, fetch_h = width * oversample, height * oversample
+    png_bytes = None
+    source = "cached"
+    if not refresh_cache:
+        png_bytes = load_cached_logo(iata, fetch_w, fetch_h)
+    if png_bytes is None:
+        limiter.acquire()
+        png_bytes = fetch_logo_png(iata, fetch_w, fetch_h)
+        source = "downloaded"
+    return decoder.decode(png_bytes, source)
+
+
+async def download_airline_logo_async(client: "httpx.AsyncClient",
+                                      entry: tuple[str, str, str], width: int,
+                                      height: int, oversample: int, refresh_cache: bool,
+                                      limiter: RateLimiter, decoder: LogoDecoder
+                                      ) -> tuple[PreparedLogo | None, str]:
+    """
+    download_airline_logo for the --http2 path. Decode and resize run on a
+    worker thread so the event loop keeps servicing the other streams.
+    """
+    _, iata, _ = entry
+
+    fetch_w, fetch_h = width * oversample, height * oversample
+    png_bytes = None
+    source = "cached"
+    if not refresh_cache:
+        png_bytes = load_cached_logo(iata, fetch_w, fetch_h)
+    if png_bytes is None:
+        await asyncio.sleep(limiter.reserve())
+        png_bytes = await fetch_logo_png_async(client, iata, fetch_w, fetch_h)
+        source = "downloaded"
+    return await asyncio.to_thread(decoder.decode, png_bytes, source)
+
+
+def download_threaded(jobs: list[int], width: int, height: int, oversample: int,
+                      refresh_cache: bool, limiter: RateLimiter,
+                      decoder: LogoDecoder, report) -> None:
+    """
+    Download AIRLINE_LIST entries (1-based indices in `jobs`) on the worker
+    pool over the shared requests session. report(idx, image, detail) is
+    called on the main thread as each one completes.
+    """
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        futures = {
+            pool.submit(download_airline_logo, AIRLINE_LIST[idx - 1], width, height,
+                        oversample, refresh_cache, limiter, decoder): idx
+            for idx in jobs
+        }
+        for future in as_completed(futures):
+            report(futures[future], *future.result())
+
+
+async def download_http2(jobs: list[int], width: int, height: int, oversample: int,
+                         refresh_cache: bool, limiter: RateLimiter,
+                         decoder: LogoDecoder, report) -> None:
+    """
+    download_threaded over a single multiplexed HTTP/2 connection. All
+    requests share one connection as concurrent streams, so there is no
+    pool to size.
+    """
+    transport = httpx.AsyncHTTPTransport(
+        http2=True,
+        retries=3,
+        limits=httpx.Limits(max_connections=1, max_keepalive_connections=1),
+    )
+    async with httpx.AsyncClient(transport=transport, headers=REQUEST_HEADERS,
+                                 timeout=10.0) as client:
+        async def run(idx: int):
+            return idx, await download_airline_logo_async(
+                client, AIRLINE_LIST[idx - 1], width, height, oversample,
+                refresh_cache, limiter, decoder)
+
+        for next_done in asyncio.as_completed([run(idx) for idx in jobs]):
+            idx, (img, detail) = await next_done
+            report(idx, img, detail)
 
 
 # ─── Main ─────────────────────────────────────────────────────────────────────
@@ -252,11 +1000,32 @@ def main():
                         help=f"Logo width in pixels (default: {DEFAULT_WIDTH})")
     parser.add_argument("--height", type=int, default=DEFAULT_HEIGHT,
                         help=f"Logo height in pixels (default: {DEFAULT_HEIGHT})")
+    parser.add_argument("--oversample", type=int, default=DEFAULT_OVERSAMPLE,
+                        help="Fetch logos N times larger than the target and downsample "
+                             f"locally for extra fidelity (default: {DEFAULT_OVERSAMPLE})")
     parser.add_argument("--out",    type=Path, default=DEFAULT_OUT,
                         help=f"Output directory (default: {DEFAULT_OUT})")
+    parser.add_argument("--split", action="store_true",
+                        help=f"Write one {{ICAO}}.bin per airline instead of the packed "
+                             f"{ATLAS_NAME} + {ATLAS_INDEX_NAME} atlas")
     parser.add_argument("--skip-existing", action="store_true",
-                        help="Skip airlines whose .bin file already exists")
+                        help="Skip airlines that already have a logo in the output")
+    parser.add_argument("--http2", action="store_true",
+                        help="Download over one multiplexed HTTP/2 connection "
+                             "(needs: pip install 'httpx[http2]')")
+    parser.add_argument("--vips", action="store_true",
+                        help="Decode, resize and pack logos with libvips instead of "
+                             "Pillow (needs: pip install 'pyvips[binary]')")
+    parser.add_argument("--refresh-cache", action="store_true",
+                        help=f"Revalidate cached PNGs in {CACHE_DIR} with the CDN "
+                             "instead of using them as-is")
     args = parser.parse_args()
+    if args.oversample < 1:
+        parser.error("--oversample must be at least 1")
+    if args.http2 and httpx is None:
+        parser.error("--http2 needs httpx and h2: pip install 'httpx[http2]'")
+    if args.vips and pyvips is None:
+        parser.error("--vips needs pyvips and libvips: pip install 'pyvips[binary]'")
 
     out_dir: Path = args.out
     out_dir.mkdir(parents=True, exist_ok=True)
@@ -268,59 +1037,166 @@ def main():
     print(f"FlightWall Logo Builder")
     print(f"  Output dir  : {out_dir}")
     print(f"  Logo size   : {width}x{height} px  ({expected_bytes} bytes each)")
+    print(f"  Fetch size  : {width * args.oversample}x{height * args.oversample} px")
     print(f"  Airlines    : {len(AIRLINE_LIST)}")
     print(f"  Total max   : {len(AIRLINE_LIST) * expected_bytes / 1024:.1f} KB")
     print()
 
+    limiter = RateLimiter(REQUEST_RATE_PER_S, burst=REQUEST_BURST)
+
     success = 0
     skipped = 0
     failed  = 0
     failed_list = []
+    total   = len(AIRLINE_LIST)
+    done    = 0
 
-    for idx, (icao, iata, name) in enumerate(AIRLINE_LIST, start=1):
-        out_path = out_dir / f"{icao.upper()}.bin"
-        prefix = f"[{idx:3d}/{len(AIRLINE_LIST)}] {icao} ({iata}) {name}"
+    # Logos from the previous atlas seed the new one: airlines that fail this
+    # run keep their old entry rather than vanishing from the device, and
+    # --skip-existing doesn't re-fetch them at all. Airlines removed from
+    # AIRLINE_LIST are dropped here, so they leave the atlas too.
+    existing: dict[str, bytes] = {}
+    if not args.split:
+        existing = {icao: blob for icao, blob in read_atlas(out_dir, width, height).items()
+                    if icao in icao_to_iata()}
 
-        if args.skip_existing and out_path.exists():
-            print(f"{prefix} — skipped (exists)")
-            skipped += 1
-            continue
+    def already_built(icao: str) -> bool:
+        if args.split:
+            return (out_dir / f"{icao.upper()}.bin").exists()
+        return icao.upper() in existing
 
-        print(f"{prefix} — downloading...", end=" ", flush=True)
-        png_bytes = fetch_logo_png(iata, width * 4, height * 4)  # fetch 4x then downsample
+    # Phase 1: download, decode and resize, on worker threads or over HTTP/2.
+    images: dict[int, PreparedLogo] = {}
+    jobs: list[int] = []
+    for idx, (icao, iata, name) in enumerate(AIRLINE_LIST, start=1):
+        if args.skip_existing and already_built(icao):
+            done += 1
+            print(f"[{done:3d}/{total}] {icao} ({iata}) {name} — skipped (exists)")
+            skipped += 1
+        else:
+            jobs.append(idx)
 
-        if png_bytes is None:
-            print("FAILED (no logo)")
+    def report(idx: int, img: PreparedLogo | None, detail: str) -> None:
+        nonlocal done, failed
+        icao, iata, name = AIRLINE_LIST[idx - 1]
+        done += 1
+        print(f"[{done:3d}/{total}] {icao} ({iata}) {name} — {detail}")
+        if img is None:
             failed += 1
-            failed_list.append(f"{icao}/{iata} {name}")
-            time.sleep(REQUEST_DELAY_S)
-            continue
+            failed_list.append((idx, f"{icao}/{iata} {name}"))
+        else:
+            images[idx] = img
 
-        try:
-            img = Image.open(io.BytesIO(png_bytes))
-            blob = image_to_rgb565_blob(img, width, height)
-            assert len(blob) == expected_bytes, f"blob size {len(blob)} != {expected_bytes}"
-            out_path.write_bytes(blob)
-            print(f"OK ({len(blob)} bytes)")
-            success += 1
-        except Exception as e:
-            print(f"FAILED ({e})")
-            failed += 1
-            failed_list.append(f"{icao}/{iata} {name}")
+    decoder = LogoDecoder(width, height, use_vips=args.vips)
+    download_args = (jobs, width, height, args.oversample, args.refresh_cache, limiter,
+                     decoder, report)
+    if args.http2:
+        asyncio.run(download_http2(*download_args))
+    else:
+        download_threaded(*download_args)
+
+    # Phase 2: encode every distinct logo in one batch, then write the atlas
+    # (or the per-airline .bin files with --split). Duplicate PNGs share one
+    # prepared object, so grouping by identity encodes each of them once.
+    # Logos from the --vips pipeline arrive already encoded.
+    groups: dict[int, list[int]] = {}
+    for idx in sorted(images):
+        groups.setdefault(id(images[idx]), []).append(idx)
+    unique = [images[members[0]] for members in groups.values()]
+    encoded = iter(encode_rgb565_batch(
+        [logo for logo in unique if isinstance(logo, Image.Image)], width, height))
+    blobs = [next(encoded) if isinstance(logo, Image.Image) else memoryview(logo)
+             for logo in unique]
+
+    logos: dict[str, bytes | memoryview] = dict(existing)
+    for members, blob in zip(groups.values(), blobs):
+        assert len(blob) == expected_bytes, f"blob size {len(blob)} != {expected_bytes}"
+        for idx in members:
+            icao, iata, name = AIRLINE_LIST[idx - 1]
+            if not args.split:
+                logos[icao.upper()] = blob
+                success += 1
+                continue
+            try:
+                write_blob(out_dir / f"{icao.upper()}.bin", blob)
+                success += 1
+            except OSError as e:
+                print(f"{icao} ({iata}) {name} — FAILED ({e})")
+                failed += 1
+                failed_list.append((idx, f"{icao}/{iata} {name}"))
 
-        time.sleep(REQUEST_DELAY_S)
+    # airlines.json goes first: the atlas digest covers it, since the device
+    # needs a new upload when only the ICAO -> IATA mapping changed. It is only
+    # rewritten when its contents differ, so an unchanged build keeps its mtime.
+    airlines_path = out_dir / "airlines.json"
+    airlines_json = json.dumps(icao_to_iata(), sort_keys=True,
+                               separators=(",", ":")).encode()
+    try:
+        airlines_unchanged = airlines_path.read_bytes() == airlines_json
+    except OSError:
+        airlines_unchanged = False
+    if airlines_unchanged:
+        print(f"ICAO -> IATA map for {len(AIRLINE_LIST)} airlines in {airlines_path} "
+              "is unchanged")
+    else:
+        _atomic_write(airlines_path, airlines_json)
+        print(f"Wrote ICAO -> IATA map for {len(AIRLINE_LIST)} airlines to {airlines_path}")
+
+    changed = True
+    if args.split:
+        print(f"Encoded {len(unique)} distinct logos, wrote {success} files "
+              f"({expected_bytes} bytes each)")
+        if (out_dir / ATLAS_NAME).exists() or (out_dir / ATLAS_INDEX_NAME).exists():
+            try:
+                carried = retire_atlas(out_dir, width, height)
+            except OSError as e:
+                print(f"ERROR: could not remove the old {ATLAS_NAME}: {e}")
+                sys.exit(1)
+            print(f"Removed {ATLAS_NAME} + {ATLAS_INDEX_NAME} from an earlier run, which "
+                  f"the firmware would read instead of these files; {carried} logos "
+                  "found only there were written out as .bin files.")
+    else:
+        if not logos:
+            print(f"ERROR: no logos were built and there is no previous {ATLAS_NAME}; "
+                  "not writing an empty atlas.")
+            sys.exit(1)
+        kept = sum(AIRLINE_LIST[idx - 1][0].upper() in existing for idx, _ in failed_list)
+        if kept:
+            print(f"Kept the previous {ATLAS_NAME} entry for {kept} failed airlines")
+        try:
+            atlas, changed = write_atlas(out_dir, logos, width, height, airlines_json)
+        except (OSError, ValueError) as e:
+            print(f"ERROR: could not write {ATLAS_NAME}: {e}")
+            sys.exit(1)
+        stored = ATLAS_HEADER.unpack_from(atlas)[0]
+        print(f"Encoded {len(unique)} distinct logos; {ATLAS_NAME} holds {stored} "
+              f"for {len(logos)} airlines ({len(atlas)} bytes)")
+        if not changed:
+            print(f"{ATLAS_NAME} and airlines.json are unchanged since the last build; "
+              "left as-is.")
 
     print()
     print("─" * 60)
     print(f"Done.  {success} OK  |  {skipped} skipped  |  {failed} failed")
     if failed_list:
         print("Failed airlines:")
-        for f in failed_list:
+        for _, f in sorted(failed_list):
             print(f"  {f}")
 
     total_kb = sum(p.stat().st_size for p in out_dir.glob("*.bin")) / 1024
+    if not args.split:
+        total_kb += (out_dir / ATLAS_INDEX_NAME).stat().st_size / 1024
+        leftovers = [p for p in out_dir.glob("*.bin") if p.name != ATLAS_NAME]
+        if leftovers:
+            print(f"Note: {len(leftovers)} per-airline .bin files from an earlier --split "
+                  f"run are still in {out_dir}; the firmware prefers {ATLAS_NAME}, so "
+                  "they can be deleted to free LittleFS space.")
     print(f"Total logo data: {total_kb:.1f} KB in {out_dir}")
     print()
+    if not changed:
+        print("Logo data unchanged since the last build — skip 'pio run --target "
+              "uploadfs' if that build was already uploaded.")
+        return
     print("Next steps:")
     print("  cd firmware")
     print("  pio run --target uploadfs")